@@ -1,8 +1,9 @@
 """Fixtures for integration tests."""
 
+import functools
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import pytest
 import yaml
@@ -11,14 +12,20 @@ from wdnas.client import WDNasClient
 from wdnas.devices.ex2 import EX2UltraDevice
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
-    """Load configuration from config file or environment variables."""
+    """Load configuration from config file or environment variables.
+
+    The result is cached, so the config file is read and parsed only once per run.
+    """
     # Try to load from config file first
     config_file = Path(__file__).parent.parent / "config.yaml"
 
     if config_file.exists():
         with open(config_file, "r") as f:
-            return yaml.safe_load(f) or {}
+            # Prefer the libyaml-backed loader when PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            return yaml.load(f, Loader=loader) or {}
 
     # Fall back to environment variables
     return {
@@ -41,7 +48,7 @@ def requires_config(config: Dict[str, Any]) -> None:
         pytest.skip(f"Missing required configuration: {', '.join(missing)}")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config() -> Dict[str, Any]:
     """Provide configuration for tests."""
     config = load_config()
@@ -49,9 +56,9 @@ def config() -> Dict[str, Any]:
     return config
 
 
-@pytest.fixture
-def client(config: Dict[str, Any]) -> WDNasClient:
-    """Create an authenticated client for testing."""
+@pytest.fixture(scope="session")
+def client(config: Dict[str, Any]) -> Iterator[WDNasClient]:
+    """Create an authenticated client shared by all integration tests."""
     client = WDNasClient(
         host=config["host"],
         username=config["username"],
@@ -61,12 +68,21 @@ def client(config: Dict[str, Any]) -> WDNasClient:
         verify_ssl=config.get("verify_ssl", False),
     )
 
-    # Authenticate
+    # Authenticate once for the whole session
     client.authenticate()
-    return client
+    yield client
+
+    client.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ex2_device(client: WDNasClient) -> EX2UltraDevice:
     """Create an EX2Ultra device instance for testing."""
     return EX2UltraDevice(client)
+
+
+@pytest.fixture(scope="session")
+def ex2_device_loaded(ex2_device: EX2UltraDevice) -> EX2UltraDevice:
+    """Provide the EX2Ultra device with all data fetched once for the session."""
+    ex2_device.get_all_data()
+    return ex2_device
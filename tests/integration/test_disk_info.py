@@ -1,19 +1,41 @@
 """Integration tests for disk information retrieval."""
 
+import os
+
 import pytest
 from wdnas.devices.ex2 import EX2UltraDevice
 from wdnas.models.disk import DiskInfo, SmartInfo
 
+# Set FAST_TESTS to skip the per-attribute type checks below. Keep them on in CI: disks are
+# built from the converter tables in wdnas/devices/ex2.py, which mypy cannot see through, so
+# these runtime checks are the only guard on the field types
+_DEEP_CHECKS = not os.getenv("FAST_TESTS")
+
+# Raw string fields copied from the NAS as-is; always checked, because an empty element must
+# come through as None and never as the string "None"
+_RAW_STR_ATTRS = ("revision", "raid_uuid", "roaming")
+
+# (attribute, expected type) pairs checked for every disk; the raw string fields, which may be
+# None, are covered by _RAW_STR_ATTRS instead
+_DISK_ATTR_TYPES = (
+    ("scsi_path", str),
+    ("connected", bool),
+    ("device_path", str),
+    ("partition_count", int),
+    ("allowed", bool),
+    ("failed", bool),
+    ("removable", bool),
+    ("over_temp", bool),
+    ("sleep", bool),
+)
+
 
 class TestDiskInfo:
     """Test disk information retrieval."""
 
-    def test_get_disks(self, ex2_device: EX2UltraDevice) -> None:
+    def test_get_disks(self, ex2_device_loaded: EX2UltraDevice) -> None:
         """Test retrieving disk information."""
-        # Make sure we have all data loaded
-        ex2_device.get_all_data()
-        
-        disks = ex2_device.get_disks()
+        disks = ex2_device_loaded.get_disks()
         
         # Should return a list with at least one disk
         assert isinstance(disks, list)
@@ -33,19 +55,21 @@ class TestDiskInfo:
             if disk.temperature:
                 assert 0 <= disk.temperature <= 100
                 
+            # Verify raw string fields were passed through unchanged
+            for name in _RAW_STR_ATTRS:
+                value = getattr(disk, name)
+                assert value is None or (
+                    isinstance(value, str) and value != "None"
+                ), f"Unexpected {name} for {disk.name}: {value!r}"
+
             # Verify fields have valid types
-            assert isinstance(disk.scsi_path, str)
-            assert isinstance(disk.connected, bool)
-            assert isinstance(disk.revision, str)
-            assert isinstance(disk.device_path, str)
-            assert isinstance(disk.partition_count, int)
-            assert isinstance(disk.allowed, bool)
-            assert isinstance(disk.raid_uuid, str)
-            assert isinstance(disk.failed, bool)
-            assert isinstance(disk.removable, bool)
-            assert isinstance(disk.roaming, str)
-            assert isinstance(disk.over_temp, bool)
-            assert isinstance(disk.sleep, bool)
+            if _DEEP_CHECKS:
+                wrong_types = [
+                    name
+                    for name, expected in _DISK_ATTR_TYPES
+                    if not isinstance(getattr(disk, name), expected)
+                ]
+                assert not wrong_types, f"Unexpected types for {disk.name}: {wrong_types}"
             
             # If smart_info is present, verify its structure
             if disk.smart_info:
@@ -53,13 +77,9 @@ class TestDiskInfo:
                 assert disk.smart_info.result
                 assert 0 <= disk.smart_info.percent <= 1.0  # percent is stored as float 0.0-1.0
 
-    def test_get_disk_smart_details(self, ex2_device: EX2UltraDevice) -> None:
+    def test_get_disk_smart_details(self, ex2_device_loaded: EX2UltraDevice) -> None:
         """Test retrieving SMART information for a disk."""
-        # First get all data
-        ex2_device.get_all_data()
-        
-        # Then get available disks
-        disks = ex2_device.get_disks()
+        disks = ex2_device_loaded.get_disks()
         
         assert disks
             
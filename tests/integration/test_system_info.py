@@ -9,12 +9,9 @@ from wdnas.models.system import SystemInfo
 class TestSystemInfo:
     """Test system information retrieval."""
 
-    def test_get_system_info(self, ex2_device: EX2UltraDevice) -> None:
+    def test_get_system_info(self, ex2_device_loaded: EX2UltraDevice) -> None:
         """Test retrieving system information."""
-        # First make sure we have all data loaded
-        ex2_device.get_all_data()
-        
-        system_info = ex2_device.get_system_info()
+        system_info = ex2_device_loaded.get_system_info()
 
         # Verify we got a valid SystemInfo object
         assert isinstance(system_info, SystemInfo)
@@ -1,12 +1,14 @@
 """Unit tests for WDNasClient."""
 
 import base64
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
-from wdnas.client import WDNasClient
+from wdnas.client import LOG_PAGE_BATCH, WDNasClient
 from wdnas.exceptions import AuthenticationError, ConnectionError, ParseError
 
 
@@ -27,6 +29,64 @@ class TestWDNasClient:
         assert client._authenticated is False
         assert client._cookies == {}
 
+    @pytest.mark.parametrize("host", ["http://nas.local", "nas.local:80", "nas.local\n", ""])
+    def test_init_invalid_host(self, host: str) -> None:
+        """Test that malformed hosts are rejected."""
+        with pytest.raises(ValueError, match="Invalid host format"):
+            WDNasClient(host=host, username="admin", password="password")
+
+    def test_session_retries_gateway_errors_on_post(self) -> None:
+        """Test that a 503 answer to a POST is retried on the shared pooled adapter."""
+        statuses = [503, 200]
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                received.append(self.path)
+                status = statuses.pop(0)
+                body = b"<response>Success</response>" if status == 200 else b""
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        thread.start()
+        try:
+            client = WDNasClient(
+                host="127.0.0.1",
+                username="admin",
+                password="password",
+                http_port=server.server_port,
+            )
+            client._authenticated = True
+            assert client.session.get_adapter("https://127.0.0.1") is client.session.get_adapter(
+                client.http_base_url
+            )
+
+            result = client._get_xml("/xml/test.xml")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert result == {"response": "Success"}
+        assert received == ["/xml/test.xml", "/xml/test.xml"]
+
+    def test_context_manager_closes_session(self) -> None:
+        """Test that leaving the context manager closes the HTTP session."""
+        client = WDNasClient(host="192.168.1.100", username="admin", password="password")
+
+        with patch.object(client.session, "close") as mock_close:
+            with client as ctx:
+                assert ctx is client
+            mock_close.assert_called_once()
+
     @patch("requests.Session.post")
     def test_authenticate_success(self, mock_post: MagicMock) -> None:
         """Test successful authentication."""
@@ -42,6 +102,7 @@ class TestWDNasClient:
         # Verify request was made correctly
         mock_post.assert_called_once()
         args, kwargs = mock_post.call_args
+        assert args[0] == "https://192.168.1.100:8543/nas/v1/auth"
         assert kwargs["json"]["username"] == "admin"
         assert kwargs["json"]["password"] == base64.b64encode(b"password").decode()
 
@@ -50,6 +111,73 @@ class TestWDNasClient:
         assert client._authenticated is True
         assert client._cookies == {"session_id": "test_session"}
 
+    @patch("requests.Session.post")
+    def test_authenticate_uses_current_credentials(self, mock_post: MagicMock) -> None:
+        """Test that credentials changed after construction are used on the next login."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.cookies = {"session_id": "test_session"}
+        mock_post.return_value = mock_response
+
+        client = WDNasClient(host="192.168.1.100", username="admin", password="password")
+        client.username = "operator"
+        client.password = "rotated"
+        client.authenticate()
+
+        _, kwargs = mock_post.call_args
+        assert kwargs["json"]["username"] == "operator"
+        assert kwargs["json"]["password"] == base64.b64encode(b"rotated").decode()
+
+    @patch("requests.Session.post")
+    def test_authenticate_concurrent_calls_share_login(self, mock_post: MagicMock) -> None:
+        """Test that a caller waiting on an in-flight login reuses it instead of posting again."""
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_post(*args: object, **kwargs: object) -> MagicMock:
+            entered.set()
+            release.wait(timeout=5)
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.cookies = {"session_id": "test_session"}
+            return mock_response
+
+        class SignallingLock:
+            """Auth lock that reports when a caller has to wait for it."""
+
+            def __init__(self) -> None:
+                self._lock = threading.Lock()
+                self.contended = threading.Event()
+
+            def __enter__(self) -> None:
+                if not self._lock.acquire(blocking=False):
+                    self.contended.set()
+                    self._lock.acquire()
+
+            def __exit__(self, *exc_info: object) -> None:
+                self._lock.release()
+
+        mock_post.side_effect = slow_post
+        client = WDNasClient(host="192.168.1.100", username="admin", password="password")
+        auth_lock = SignallingLock()
+        client._auth_lock = auth_lock  # type: ignore[assignment]
+
+        results = []
+        first = threading.Thread(target=lambda: results.append(client.authenticate()))
+        first.start()
+        assert entered.wait(timeout=5)
+        second = threading.Thread(target=lambda: results.append(client.authenticate()))
+        second.start()
+        # The second caller reads the login generation before taking the lock, so once it is
+        # blocked on the lock it is guaranteed to observe the first login completing
+        assert auth_lock.contended.wait(timeout=5)
+        release.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+
+        assert results == [True, True]
+        mock_post.assert_called_once()
+
     @patch("requests.Session.post")
     def test_authenticate_failure(self, mock_post: MagicMock) -> None:
         """Test authentication failure."""
@@ -96,7 +224,7 @@ class TestWDNasClient:
         # Mock a successful response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "<response>Success</response>"
+        mock_response.content = b"<response>Success</response>"
         mock_post.return_value = mock_response
 
         # Prepare parsed XML response
@@ -111,7 +239,7 @@ class TestWDNasClient:
 
             # Verify the response is parsed correctly
             assert response == parsed_response
-            mock_parse.assert_called_once_with("<response>Success</response>".strip())
+            mock_parse.assert_called_once_with(b"<response>Success</response>")
 
     @patch("requests.Session.post")
     def test_parse_xml_response_as_dict(self, mock_post: MagicMock) -> None:
@@ -132,7 +260,7 @@ class TestWDNasClient:
         # Mock the system status response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "<response><status>OK</status></response>"
+        mock_response.content = b"<response><status>OK</status></response>"
         mock_post.return_value = mock_response
 
         parsed_response = {"response": {"status": "OK"}}
@@ -145,6 +273,102 @@ class TestWDNasClient:
             assert result == parsed_response
             mock_post.assert_called_once()
 
+    def test_get_disks_smart_info_skips_empty_bays(self) -> None:
+        """Test that an empty bay is skipped without dropping the disks after it."""
+        client = WDNasClient(host="192.168.1.100", username="admin", password="password")
+        client._authenticated = True
+
+        smart_rows = {"rows": {"row": [{"cell": ["1", "Raw Read Error Rate", "100", "100", "16"]}]}}
+
+        def fake_post_cgi(endpoint: str, data: dict) -> dict:
+            return {"rows": {}} if data["f_field"] == "sda" else smart_rows
+
+        with patch.object(client, "_post_cgi", side_effect=fake_post_cgi) as mock_post_cgi:
+            result = client.get_disks_smart_info()
+
+        assert mock_post_cgi.call_count == 2
+        assert result == {"sdb": smart_rows}
+
+    @pytest.mark.parametrize("pages_with_rows, max_pages, expected_pages", [(2, 10, 3), (6, 5, 5)])
+    def test_get_system_logs_pagination(
+        self, pages_with_rows: int, max_pages: int, expected_pages: int
+    ) -> None:
+        """Test that log pages are returned in order up to the first empty page."""
+        client = WDNasClient(host="192.168.1.100", username="admin", password="password")
+        client._authenticated = True
+
+        def fake_post_cgi(endpoint: str, data: dict, json_response: bool = False) -> dict:
+            page = int(data["page"])
+            return {"rows": [{"cell": ["INFO", str(page)]}] if page <= pages_with_rows else []}
+
+        with patch.object(client, "_post_cgi", side_effect=fake_post_cgi):
+            result = client.get_system_logs(max_pages=max_pages)
+
+        assert len(result) == expected_pages
+        assert [page["rows"][0]["cell"][1] for page in result if page["rows"]] == [
+            str(page) for page in range(1, min(pages_with_rows, max_pages) + 1)
+        ]
+
+    def test_iter_system_logs_stops_early(self) -> None:
+        """Test that the log iterator does not fetch further batches once the caller stops."""
+        client = WDNasClient(host="192.168.1.100", username="admin", password="password")
+        client._authenticated = True
+
+        page_data = {"rows": [{"cell": ["INFO", "2023/05/15 12:30:45", "system", "started"]}]}
+        with patch.object(client, "_post_cgi", return_value=page_data) as mock_post_cgi:
+            logs = client.iter_system_logs(max_pages=10)
+            first_page = next(logs)
+            # Closing the generator shuts its executor down, so every request it made has
+            # finished before the patch is undone
+            logs.close()
+            requested = [int(call.args[1]["page"]) for call in mock_post_cgi.call_args_list]
+
+        assert first_page == page_data
+        assert requested
+        assert max(requested) <= LOG_PAGE_BATCH
+
+    def test_static_info_is_cached_until_invalidated(self) -> None:
+        """Test that firmware and device info are fetched once until the cache is cleared."""
+        client = WDNasClient(host="192.168.1.100", username="admin", password="password")
+        client._authenticated = True
+
+        with patch.object(client, "_post_cgi", return_value={"version": "1.0"}) as mock_post_cgi:
+            assert client.get_firmware_version() == {"version": "1.0"}
+            assert client.get_firmware_version() == {"version": "1.0"}
+            client.get_device_info()
+            client.get_device_info()
+            assert mock_post_cgi.call_count == 2
+
+            client.invalidate_cache()
+            client.get_firmware_version()
+            assert mock_post_cgi.call_count == 3
+
+    def test_static_info_cache_expires(self) -> None:
+        """Test that cached responses are fetched again once the TTL has passed."""
+        client = WDNasClient(host="192.168.1.100", username="admin", password="password")
+        client._authenticated = True
+
+        with (
+            patch.object(client, "_post_cgi", return_value={"version": "1.0"}) as mock_post_cgi,
+            patch("wdnas.client.STATIC_INFO_TTL", 0),
+        ):
+            client.get_firmware_version()
+            client.get_firmware_version()
+            assert mock_post_cgi.call_count == 2
+
+    def test_static_info_cache_returns_copies(self) -> None:
+        """Test that mutating a returned response does not corrupt the cached one."""
+        client = WDNasClient(host="192.168.1.100", username="admin", password="password")
+        client._authenticated = True
+
+        response = {"device_info": {"name": "MyNAS"}}
+        with patch.object(client, "_post_cgi", return_value=response) as mock_post_cgi:
+            client.get_device_info()["device_info"]["name"] = "changed on fetch"
+            client.get_device_info()["device_info"]["name"] = "changed on cache hit"
+
+            assert client.get_device_info() == {"device_info": {"name": "MyNAS"}}
+            assert mock_post_cgi.call_count == 1
+
     @patch("requests.Session.post")
     def test_get_all_data(self, mock_post: MagicMock) -> None:
         """Test get_all_data method."""
@@ -196,6 +420,9 @@ class TestWDNasClient:
         result = client.parse_json_response(json_text)
         assert result == {"key": "value", "number": 42}
 
+        # Test parsing raw response bytes
+        assert client.parse_json_response(b'{"key": "value"}') == {"key": "value"}
+
         # Test parsing failure
         with pytest.raises(ParseError) as excinfo:
             client.parse_json_response('{"invalid": json}')
@@ -1,232 +1,331 @@
 """Unit tests for the EX2UltraDevice implementation."""
 
+import logging
+import pickle
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, cast
 
 import pytest
 
+from wdnas.client import WDNasClient
 from wdnas.devices.ex2 import EX2UltraDevice
 from wdnas.models.disk import DiskInfo, SmartAttribute, SmartInfo
 from wdnas.models.system import LogEntry, RaidInfo, SystemInfo, VolumeInfo
 
-
-class TestEX2UltraDevice:
-    """Tests for the EX2UltraDevice class."""
-
-    @pytest.fixture
-    def mock_client(self) -> MagicMock:
-        """Create a mock client with test data."""
-        mock_client = MagicMock()
-        # Create realistic test data that the client would return
-        test_data = {
-            "system_status": {
-                "config": {
-                    "raids": {
-                        "raid": [
-                            {
-                                "id": "1",
-                                "level": "raid1",
-                                "chunk_size": "512",
-                                "num_of_total_disks": "2",
-                                "num_of_raid_disks": "2",
-                                "num_of_active_disks": "2",
-                                "num_of_working_disks": "2",
-                                "num_of_spare_disks": "0",
-                                "num_of_failed_disks": "0",
-                                "raid_disks": "sda, sdb",
-                                "spare_disks": "",
-                                "failed_disks": "",
-                                "rebuilding_disks": "",
-                                "size": "1000000000",
-                                "used_size": "500000000",
-                                "min_req_size": "1000000000",
-                                "state": "clean",
-                                "state_detail": "",
-                                "uuid": "12345678-abcd-ef12-3456-789abcdef123",
-                                "dev": "md0",
-                                "ar": "0",
-                                "expand_size": "0",
-                                "expand_no_replace": "0",
-                                "migrate_from": "",
-                                "migrate_to": "",
-                                "recover_failed": "0",
-                                "reshape_failed": "0",
-                                "dirty": "0",
-                            }
-                        ]
+# Realistic client.get_all_data() output, built once at import time
+_BASE_PAYLOAD: Dict[str, Any] = {
+    "system_status": {
+        "xml": {
+            "lan_r_speed": "1000",
+            "lan_t_speed": "1000",
+            "lan2_r_speed": "0",
+            "lan2_t_speed": "0",
+            "mem_total": "512000000",
+            "mem_free": "256000000",
+            "buffers": "50000000",
+            "cached": "100000000",
+            "cpu": "25%",
+        }
+    },
+    "device_info": {
+        "device_info": {
+            "serial_number": "WD-1234567890",
+            "name": "MyNAS",
+            "workgroup": "WORKGROUP",
+            "description": "WD My Cloud EX2 Ultra",
+        }
+    },
+    "system_logs": [
+        {
+            "rows": [
+                {"cell": ["INFO", "2023/05/15 12:30:45", "system", "System started"]},
+                {"cell": ["WARN", "2023/05/15 12:35:10", "network", "Connection dropped"]},
+            ]
+        },
+        {"rows": []},
+    ],
+    "firmware_version": {
+        "version": {
+            "fw": "2.31.204",
+            "oled": "1.0",
+        }
+    },
+    "home_info": {
+        "config": {
+            "fan": "4000",
+        }
+    },
+    "disks_smart_info": {
+        "sda": {
+            "rows": {
+                "row": [
+                    {"cell": ["1", "Raw Read Error Rate", "100", "100", "16"]},
+                    {"cell": ["5", "Reallocated Sectors Count", "100", "100", "10"]},
+                ]
+            }
+        },
+        "sdb": {
+            "rows": {
+                "row": [
+                    {"cell": ["1", "Raw Read Error Rate", "98", "98", "16"]},
+                    {"cell": ["5", "Reallocated Sectors Count", "99", "99", "10"]},
+                ]
+            }
+        },
+    },
+    "system_info": {
+        "config": {
+            "disks": {
+                "disk": [
+                    {
+                        "name": "sda",
+                        "scsi_path": "/dev/scsi/host0/bus0/target0/lun0",
+                        "connected": "1",
+                        "vendor": "WDC",
+                        "model": "WD10EFRX-68FYTN0",
+                        "rev": "1.0",
+                        "sn": "WD-ABC123456789",
+                        "dev": "/dev/sda",
+                        "size": "1000000000000",
+                        "part_cnt": "2",
+                        "allowed": "1",
+                        "raid_uuid": "12345678-abcd-ef12-3456-789abcdef123",
+                        "failed": "0",
+                        "healthy": "1",
+                        "removable": "0",
+                        "roaming": "no",
+                        "temp": "40",
+                        "over_temp": "0",
+                        "sleep": "0",
+                        "smart": {
+                            "test": "Short",
+                            "result": "Pass [2023/05/15 12:30:45]",
+                            "percent": "95",
+                        },
                     },
-                    "vols": {
-                        "vol": [
-                            {
-                                "num": "1",
-                                "name": "Volume_1",
-                                "label": "NAS_Volume",
-                                "mount_point": "/mnt/HD/HD_a2",
-                                "encrypted": "false",
-                                "device_path": "/dev/md0",
-                                "unlocked": "true",
-                                "mounted": "true",
-                                "size": "1000000000",
-                                "uuid": "12345678-abcd-ef12-3456-789abcdef123",
-                                "roaming": "false",
-                                "used_size": "500000000",
-                                "raid_level": "raid1",
-                                "raid_state": "clean",
-                                "raid_state_detail": "",
-                                "state": "normal",
-                            }
-                        ]
+                    {
+                        "name": "sdb",
+                        "scsi_path": "/dev/scsi/host0/bus0/target1/lun0",
+                        "connected": "1",
+                        "vendor": "WDC",
+                        "model": "WD10EFRX-68FYTN0",
+                        "rev": "1.0",
+                        "sn": "WD-XYZ987654321",
+                        "dev": "/dev/sdb",
+                        "size": "1000000000000",
+                        "part_cnt": "2",
+                        "allowed": "1",
+                        "raid_uuid": "12345678-abcd-ef12-3456-789abcdef123",
+                        "failed": "0",
+                        "healthy": "1",
+                        "removable": "0",
+                        "roaming": "no",
+                        "temp": "38",
+                        "over_temp": "0",
+                        "sleep": "0",
+                        "smart": {
+                            "test": "Short",
+                            "result": "Pass [2023/05/15 12:31:30]",
+                            "percent": "90",
+                        },
                     },
-                },
-                "lan_r_speed": "1000",
-                "lan_t_speed": "1000",
-                "lan2_r_speed": "0",
-                "lan2_t_speed": "0",
-                "mem_total": "512000000",
-                "mem_free": "256000000",
-                "buffers": "50000000",
-                "cached": "100000000",
-                "cpu": "25%",
-            },
-            "device_info": {
-                "serial_number": "WD-1234567890",
-                "name": "MyNAS",
-                "workgroup": "WORKGROUP",
-                "description": "WD My Cloud EX2 Ultra",
-            },
-            "system_logs": {
-                "rows": [
-                    {"cell": ["INFO", "2023/05/15 12:30:45", "system", "System started"]},
-                    {"cell": ["WARN", "2023/05/15 12:35:10", "network", "Connection dropped"]},
                 ]
             },
-            "firmware_version": {
-                "fw": "2.31.204",
-                "oled": "1.0",
-            },
-            "home_info": {
-                "fan": "4000",
-            },
-            "disks_smart_info": {
-                "sda": {
-                    "percent": "95",
-                    "attributes": [
-                        {
-                            "id": "1",
-                            "name": "Raw Read Error Rate",
-                            "value": "100",
-                            "worst": "100",
-                            "threshold": "16",
-                        },
-                        {
-                            "id": "5",
-                            "name": "Reallocated Sectors Count",
-                            "value": "100",
-                            "worst": "100",
-                            "threshold": "10",
-                        },
-                    ],
-                },
-                "sdb": {
-                    "percent": "90",
-                    "attributes": [
-                        {
-                            "id": "1",
-                            "name": "Raw Read Error Rate",
-                            "value": "98",
-                            "worst": "98",
-                            "threshold": "16",
-                        },
-                        {
-                            "id": "5",
-                            "name": "Reallocated Sectors Count",
-                            "value": "99",
-                            "worst": "99",
-                            "threshold": "10",
-                        },
-                    ],
-                },
+            "raids": {
+                "raid": [
+                    {
+                        "id": "1",
+                        "level": "raid1",
+                        "chunk_size": "512",
+                        "num_of_total_disks": "2",
+                        "num_of_raid_disks": "2",
+                        "num_of_active_disks": "2",
+                        "num_of_working_disks": "2",
+                        "num_of_spare_disks": "0",
+                        "num_of_failed_disks": "0",
+                        "raid_disks": "sda, sdb",
+                        "spare_disks": "",
+                        "failed_disks": "",
+                        "rebuilding_disks": "",
+                        "size": "1000000000",
+                        "used_size": "500000000",
+                        "min_req_size": "1000000000",
+                        "state": "clean",
+                        "state_detail": "",
+                        "uuid": "12345678-abcd-ef12-3456-789abcdef123",
+                        "dev": "md0",
+                        "ar": "0",
+                        "expand_size": "0",
+                        "expand_no_replace": "0",
+                        "migrate_from": "",
+                        "migrate_to": "",
+                        "recover_failed": "0",
+                        "reshape_failed": "0",
+                        "dirty": "0",
+                    }
+                ]
             },
-            "system_info": {
-                "config": {
-                    "disks": {
-                        "disk": [
-                            {
-                                "name": "sda",
-                                "scsi_path": "/dev/scsi/host0/bus0/target0/lun0",
-                                "connected": "1",
-                                "vendor": "WDC",
-                                "model": "WD10EFRX-68FYTN0",
-                                "revision": "1.0",
-                                "serial": "WD-ABC123456789",
-                                "device_path": "/dev/sda",
-                                "size": "1000000000000",
-                                "partition_count": "2",
-                                "allowed": "1",
-                                "raid_uuid": "12345678-abcd-ef12-3456-789abcdef123",
-                                "failed": "0",
-                                "healthy": "1",
-                                "removable": "0",
-                                "roaming": "no",
-                                "temperature": "40",
-                                "over_temp": "0",
-                                "sleep": "0",
-                                "smart": {
-                                    "result": "Pass [2023/05/15 12:30:45]",
-                                    "test_type": "Short",
-                                },
-                            },
-                            {
-                                "name": "sdb",
-                                "scsi_path": "/dev/scsi/host0/bus0/target1/lun0",
-                                "connected": "1",
-                                "vendor": "WDC",
-                                "model": "WD10EFRX-68FYTN0",
-                                "revision": "1.0",
-                                "serial": "WD-XYZ987654321",
-                                "device_path": "/dev/sdb",
-                                "size": "1000000000000",
-                                "partition_count": "2",
-                                "allowed": "1",
-                                "raid_uuid": "12345678-abcd-ef12-3456-789abcdef123",
-                                "failed": "0",
-                                "healthy": "1",
-                                "removable": "0",
-                                "roaming": "no",
-                                "temperature": "38",
-                                "over_temp": "0",
-                                "sleep": "0",
-                                "smart": {
-                                    "result": "Pass [2023/05/15 12:31:30]",
-                                    "test_type": "Short",
-                                },
-                            },
-                        ]
+            "vols": {
+                "vol": [
+                    {
+                        "num": "1",
+                        "name": "Volume_1",
+                        "label": "NAS_Volume",
+                        "mnt": "/mnt/HD/HD_a2",
+                        "encrypted": "false",
+                        "dev": "/dev/md0",
+                        "unlocked": "true",
+                        "mounted": "true",
+                        "size": "1000000000",
+                        "uuid": "12345678-abcd-ef12-3456-789abcdef123",
+                        "roaming": "false",
+                        "used_size": "500000000",
+                        "raid_level": "raid1",
+                        "raid_state": "clean",
+                        "raid_state_detail": "",
+                        "state": "normal",
                     }
-                }
+                ]
             },
         }
+    },
+}
+
+# Serialized once so mutating tests can clone the payload with a single pickle.loads
+_BASE_PAYLOAD_PICKLE = pickle.dumps(_BASE_PAYLOAD, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+# Shared by read-only tests; any attempt to mutate it raises TypeError
+_FROZEN_PAYLOAD: Mapping[str, Any] = _freeze(_BASE_PAYLOAD)
+
+
+# Models the payload above is expected to produce
+_EXPECTED_RAID = RaidInfo(
+    id=1,
+    level="raid1",
+    chunk_size=512,
+    num_of_total_disks=2,
+    num_of_raid_disks=2,
+    num_of_active_disks=2,
+    num_of_working_disks=2,
+    num_of_spare_disks=0,
+    num_of_failed_disks=0,
+    raid_disks="sda, sdb",
+    spare_disks="",
+    failed_disks="",
+    rebuilding_disks="",
+    size=1000000000,
+    used_size=500000000,
+    min_req_size=1000000000,
+    state="clean",
+    state_detail="",
+    uuid="12345678-abcd-ef12-3456-789abcdef123",
+    dev="md0",
+    ar=0,
+    expand_size=0,
+    expand_no_replace=0,
+    migrate_from="",
+    migrate_to="",
+    recover_failed=0,
+    reshape_failed=0,
+    dirty=0,
+)
+_EXPECTED_VOLUME = VolumeInfo(
+    id=1,
+    name="Volume_1",
+    label="NAS_Volume",
+    mount_point="/mnt/HD/HD_a2",
+    encrypted=False,
+    device_path="/dev/md0",
+    unlocked=True,
+    mounted=True,
+    size=1000000000,
+    uuid="12345678-abcd-ef12-3456-789abcdef123",
+    roaming=False,
+    used_size=500000000,
+    raid_level="raid1",
+    raid_state="clean",
+    raid_state_detail="",
+    state="normal",
+)
+_EXPECTED_LOGS = [
+    LogEntry(
+        timestamp="2023/05/15 12:30:45", level="INFO", service="system", message="System started"
+    ),
+    LogEntry(
+        timestamp="2023/05/15 12:35:10",
+        level="WARN",
+        service="network",
+        message="Connection dropped",
+    ),
+]
+_EXPECTED_SDA_ATTRIBUTES = [
+    SmartAttribute(id=1, name="Raw Read Error Rate", value=100, worst=100, threshold=16),
+    SmartAttribute(id=5, name="Reallocated Sectors Count", value=100, worst=100, threshold=10),
+]
+
+
+class StubClient:
+    """Lightweight stand-in for WDNasClient that serves a fixed payload."""
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self.data = data
+        self.calls = 0
+        self.logger = logging.getLogger("wdnas")
+
+    def get_all_data(self) -> Mapping[str, Any]:
+        self.calls += 1
+        return self.data
+
+
+def make_device(client: StubClient) -> EX2UltraDevice:
+    """Create a device backed by a stub client."""
+    return EX2UltraDevice(cast(WDNasClient, client))
 
-        mock_client.get_all_data.return_value = test_data
-        return mock_client
 
-    def test_get_all_data(self, mock_client: MagicMock) -> None:
-        """Test get_all_data method."""
-        device = EX2UltraDevice(mock_client)
+class TestEX2UltraDevice:
+    """Tests for the EX2UltraDevice class."""
+
+    @pytest.fixture
+    def mock_client(self) -> StubClient:
+        """Create a stub client with a private copy of the test data, safe to mutate."""
+        return StubClient(pickle.loads(_BASE_PAYLOAD_PICKLE))
+
+    @pytest.fixture
+    def mock_client_ro(self) -> StubClient:
+        """Create a stub client sharing the frozen test data, for tests that never mutate it."""
+        return StubClient(_FROZEN_PAYLOAD)
+
+    @pytest.fixture
+    def populated_device(self, mock_client_ro: StubClient) -> EX2UltraDevice:
+        """Create a device with the shared test data already loaded."""
+        device = make_device(mock_client_ro)
         device.get_all_data()
+        return device
 
+    def test_get_all_data(
+        self, populated_device: EX2UltraDevice, mock_client_ro: StubClient
+    ) -> None:
+        """Test get_all_data method."""
         # Verify client method was called
-        mock_client.get_all_data.assert_called_once()
+        assert mock_client_ro.calls == 1
 
         # Verify data was stored
-        assert device.all_data == mock_client.get_all_data.return_value
+        assert populated_device.all_data == mock_client_ro.data
 
-    def test_get_system_info(self, mock_client: MagicMock) -> None:
+    def test_get_system_info(self, populated_device: EX2UltraDevice) -> None:
         """Test get_system_info method."""
-        device = EX2UltraDevice(mock_client)
-        device.get_all_data()
-
-        system_info = device.get_system_info()
+        system_info = populated_device.get_system_info()
 
         # Verify system info object has correct attributes
         assert isinstance(system_info, SystemInfo)
@@ -243,36 +342,14 @@ class TestEX2UltraDevice:
         assert system_info.memory_cached == 100000000
         assert system_info.cpu_usage == 0.25  # 25% as float
 
-        # Verify raids are parsed correctly
-        assert len(system_info.raids) == 1
-        raid = system_info.raids[0]
-        assert isinstance(raid, RaidInfo)
-        assert raid.id == 1
-        assert raid.level == "raid1"
-        assert raid.raid_disks == "sda, sdb"
-        assert raid.state == "clean"
-
-        # Verify volumes are parsed correctly
-        assert len(system_info.volumes) == 1
-        volume = system_info.volumes[0]
-        assert isinstance(volume, VolumeInfo)
-        assert volume.name == "Volume_1"
-        assert volume.label == "NAS_Volume"
-        assert volume.mount_point == "/mnt/HD/HD_a2"
-
-        # Verify logs are parsed correctly
-        assert len(system_info.logs) == 2
-        assert system_info.logs[0].level == "INFO"
-        assert system_info.logs[0].message == "System started"
-        assert system_info.logs[1].level == "WARN"
-        assert system_info.logs[1].message == "Connection dropped"
-
-    def test_get_disks(self, mock_client: MagicMock) -> None:
-        """Test get_disks method."""
-        device = EX2UltraDevice(mock_client)
-        device.get_all_data()
+        # Verify raids, volumes and logs are parsed correctly (field-by-field dataclass equality)
+        assert system_info.raids == [_EXPECTED_RAID]
+        assert system_info.volumes == [_EXPECTED_VOLUME]
+        assert system_info.logs == _EXPECTED_LOGS
 
-        disks = device.get_disks()
+    def test_get_disks(self, populated_device: EX2UltraDevice) -> None:
+        """Test get_disks method."""
+        disks = populated_device.get_disks()
 
         # Verify we got two disks
         assert len(disks) == 2
@@ -298,13 +375,7 @@ class TestEX2UltraDevice:
         assert disk1.smart_info.percent == 0.95
 
         # Verify SMART attributes for first disk
-        assert len(disk1.smart_info.attributes) == 2
-        attr1 = disk1.smart_info.attributes[0]
-        assert attr1.id == 1
-        assert attr1.name == "Raw Read Error Rate"
-        assert attr1.value == 100
-        assert attr1.worst == 100
-        assert attr1.threshold == 16
+        assert disk1.smart_info.attributes == _EXPECTED_SDA_ATTRIBUTES
 
         # Verify second disk
         disk2 = disks[1]
@@ -316,12 +387,68 @@ class TestEX2UltraDevice:
         assert disk2.smart_info.date == datetime(2023, 5, 15, 12, 31, 30)
         assert disk2.smart_info.percent == 0.90
 
-    def test_get_disks_missing_data(self, mock_client: MagicMock) -> None:
+    @pytest.mark.parametrize("field", ["spare_disks", "state_detail", "migrate_from"])
+    def test_get_system_info_keeps_empty_raid_fields(
+        self, mock_client: StubClient, field: str
+    ) -> None:
+        """Test that an empty raid element (None from xmltodict) stays None."""
+        mock_client.data["system_info"]["config"]["raids"]["raid"][0][field] = None
+        device = make_device(mock_client)
+        device.get_all_data()
+
+        assert getattr(device.get_system_info().raids[0], field) is None
+
+    @pytest.mark.parametrize(
+        "key, attribute",
+        [
+            ("raid_state_detail", "raid_state_detail"),
+            ("label", "label"),
+            ("state", "state"),
+            ("raid_level", "raid_level"),
+        ],
+    )
+    def test_get_system_info_keeps_empty_volume_fields(
+        self, mock_client: StubClient, key: str, attribute: str
+    ) -> None:
+        """Test that an empty volume element (None from xmltodict) stays None."""
+        mock_client.data["system_info"]["config"]["vols"]["vol"][0][key] = None
+        device = make_device(mock_client)
+        device.get_all_data()
+
+        assert getattr(device.get_system_info().volumes[0], attribute) is None
+
+    def test_get_system_info_keeps_null_log_fields(self, mock_client: StubClient) -> None:
+        """Test that a null log level or service (JSON null) stays None instead of raising."""
+        mock_client.data["system_logs"][0]["rows"][0]["cell"] = [
+            None,
+            "2023/05/15 12:30:45",
+            None,
+            "System started",
+        ]
+        device = make_device(mock_client)
+        device.get_all_data()
+
+        entry = device.get_system_info().logs[0]
+        assert entry.level is None
+        assert entry.service is None
+
+    @pytest.mark.parametrize("key, attribute", [("roaming", "roaming"), ("rev", "revision")])
+    def test_get_disks_keeps_empty_string_fields(
+        self, mock_client: StubClient, key: str, attribute: str
+    ) -> None:
+        """Test that an empty disk element (None from xmltodict) stays None."""
+        mock_client.data["system_info"]["config"]["disks"]["disk"][0][key] = None
+        device = make_device(mock_client)
+        device.get_all_data()
+
+        assert getattr(device.get_disks()[0], attribute) is None
+
+    def test_get_disks_missing_data(self, mock_client: StubClient) -> None:
         """Test get_disks method with missing data."""
-        device = EX2UltraDevice(mock_client)
+        device = make_device(mock_client)
 
         # Remove disk data from mock response
-        mock_client.get_all_data.return_value["system_info"]["config"]["disks"]["disk"] = []
+        mock_client.data["system_info"]["config"]["disks"]["disk"] = []
         device.get_all_data()
 
         # Should raise ValueError when trying to get disks
@@ -330,54 +457,87 @@ class TestEX2UltraDevice:
 
         assert "not found in system info" in str(excinfo.value)
 
-    def test_get_system_info_with_empty_data(self, mock_client: MagicMock) -> None:
-        """Test get_system_info method with empty or invalid data."""
-        device = EX2UltraDevice(mock_client)
-
-        # Test with empty raid data
-        mock_client.get_all_data.return_value["system_status"]["config"]["raids"]["raid"] = []
+    @pytest.mark.parametrize(
+        "path,empty_value,attribute",
+        [
+            (["system_info", "config", "raids", "raid"], [], "raids"),
+            (["system_info", "config", "vols", "vol"], [], "volumes"),
+            (["system_logs"], [{"rows": []}], "logs"),
+        ],
+    )
+    def test_get_system_info_with_empty_data(
+        self, mock_client: StubClient, path: List[str], empty_value: Any, attribute: str
+    ) -> None:
+        """Test get_system_info method with empty raid, volume or log data."""
+        parent = mock_client.data
+        for key in path[:-1]:
+            parent = parent[key]
+        parent[path[-1]] = empty_value
+
+        device = make_device(mock_client)
         device.get_all_data()
 
         system_info = device.get_system_info()
-        assert len(system_info.raids) == 0
-
-        # Test with empty volume data
-        mock_client.get_all_data.return_value["system_status"]["config"]["vols"]["vol"] = []
+        assert len(getattr(system_info, attribute)) == 0
+
+    @pytest.mark.parametrize(
+        "smart_result,expected_result,expected_date",
+        [
+            ("Pass [2023/05/15 12:30:45]", "Pass", datetime(2023, 5, 15, 12, 30, 45)),
+            ("Fail [2024/01/02 03:04:05]", "Fail", datetime(2024, 1, 2, 3, 4, 5)),
+            ("Pass [2024/1/2 3:04:05]", "Pass", datetime(2024, 1, 2, 3, 4, 5)),
+            ("Not Tested [2025/02/28 02:07:22]", "Not Tested", datetime(2025, 2, 28, 2, 7, 22)),
+            (" Pass [2024/01/02 03:04:05]", "Pass", datetime(2024, 1, 2, 3, 4, 5)),
+        ],
+    )
+    def test_smart_date_parsing(
+        self,
+        mock_client: StubClient,
+        smart_result: str,
+        expected_result: str,
+        expected_date: datetime,
+    ) -> None:
+        """Test SMART result and date parsing."""
+        mock_client.data["system_info"]["config"]["disks"]["disk"][0]["smart"]["result"] = (
+            smart_result
+        )
+        device = make_device(mock_client)
         device.get_all_data()
 
-        system_info = device.get_system_info()
-        assert len(system_info.volumes) == 0
-
-        # Test with empty logs data
-        mock_client.get_all_data.return_value["system_logs"]["rows"] = []
+        disks = device.get_disks()
+        assert disks[0].smart_info is not None
+        assert disks[0].smart_info.result == expected_result
+        assert disks[0].smart_info.date == expected_date
+
+    def test_smart_result_without_date(self, mock_client: StubClient) -> None:
+        """Test that a SMART result without a test date is rejected."""
+        mock_client.data["system_info"]["config"]["disks"]["disk"][0]["smart"]["result"] = "Pass"
+        device = make_device(mock_client)
         device.get_all_data()
 
-        system_info = device.get_system_info()
-        assert len(system_info.logs) == 0
-
-    def test_smart_date_parsing(self, mock_client: MagicMock) -> None:
-        """Test SMART date parsing with various formats."""
-        device = EX2UltraDevice(mock_client)
-
-        # Test with various date formats
-        date_formats = [
-            "Pass [2023/05/15 12:30:45]",  # Standard format
-            "Pass [2023-05-15 12:30:45]",  # Alternative format
-            "Pass [invalid date]",  # Invalid format
-            "Pass",  # No date
-        ]
-
-        for i, date_str in enumerate(date_formats):
-            mock_client.get_all_data.return_value["system_info"]["config"]["disks"]["disk"][0][
-                "smart"
-            ]["result"] = date_str
-            device.get_all_data()
+        with pytest.raises(ValueError) as excinfo:
+            device.get_disks()
 
-            # Only test the first case which should parse correctly
-            if i == 0:
-                disks = device.get_disks()
-                assert disks[0].smart_info is not None
-                assert disks[0].smart_info.date == datetime(2023, 5, 15, 12, 30, 45)
+        assert "Unexpected SMART result format" in str(excinfo.value)
+
+    @pytest.mark.parametrize(
+        "smart_result",
+        [
+            "Pass [2024/01/02T03:04:05]",
+            "Pass [2024/01/02 03-04-05]",
+            "Pass [2024/+1/02 03:04:05]",
+            "Pass [2024/13/02 03:04:05]",
+        ],
+    )
+    def test_smart_result_with_malformed_date(
+        self, mock_client: StubClient, smart_result: str
+    ) -> None:
+        """Test that a SMART date not in "YYYY/MM/DD HH:MM:SS" format is rejected."""
+        mock_client.data["system_info"]["config"]["disks"]["disk"][0]["smart"]["result"] = (
+            smart_result
+        )
+        device = make_device(mock_client)
+        device.get_all_data()
 
-            # The other cases would cause exceptions but we're not testing error handling here
-            # so we skip them.
\ No newline at end of file
+        with pytest.raises(ValueError):
+            device.get_disks()
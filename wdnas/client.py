@@ -1,18 +1,40 @@
 """Core client for interacting with Western Digital NAS devices."""
 
 import base64
+import copy
 import json
 import logging
 import re
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 import requests
 import xmltodict
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
 from .exceptions import AuthenticationError, ConnectionError, ParseError
 
 TIMEOUT_REQUESTS = 10
+CGI_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}  # All CGI calls use this
+POOL_MAXSIZE = 12  # Keep-alive connections per host, enough for get_all_data's fan-out
+LOG_PAGE_BATCH = 4  # System log pages requested at once while paginating
+# Retry dropped connections and gateway errors with a short backoff, then let callers see the
+# status. Every call is a POST, and the CGI reads and the login are safe to repeat, so POST
+# has to be allowed explicitly (urllib3 excludes it from status retries by default)
+RETRY_POLICY = Retry(
+    total=2,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+    raise_on_status=False,
+)
+STATIC_INFO_TTL = 300  # Seconds to reuse responses that rarely change (firmware, device info)
+HOST_RE = re.compile(r"\A[\w.-]+\Z")  # Hostname or IPv4 address, no scheme or port
 
 
 class WDNasClient:
@@ -39,23 +61,85 @@ class WDNasClient:
         self.host = host
         self.username = username
         self.password = password
+        # Serializes logins; the generation lets threads that queued behind a successful
+        # login reuse it instead of posting again
+        self._auth_lock = threading.Lock()
+        self._auth_generation = 0
         self.http_port = http_port
         self.https_port = https_port
         self.session = requests.Session()
         self.logger = logging.getLogger("wdnas")
         self._authenticated = False
-        self._cookies: Dict[str, str] = {}
+        # Endpoint key -> (monotonic fetch time, response), see _cached
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
         # Build the base URLs
         self.http_base_url = f"http://{host}:{http_port}"
         self.https_base_url = f"https://{host}:{https_port}"
+        self._auth_url = f"{self.https_base_url}/nas/v1/auth"
 
         self.session.verify = verify_ssl  # Allow SSL verification to be configurable
 
+        # Reuse TCP/TLS connections across calls instead of reconnecting each time
+        adapter = HTTPAdapter(
+            pool_connections=2, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY_POLICY
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         # Validate host format
-        if not re.match(r"^[\w.-]+$", host):
+        if not HOST_RE.match(host):
             raise ValueError("Invalid host format")
 
+    @property
+    def _cookies(self) -> Dict[str, str]:
+        """Cookies currently held by the session (sent automatically with each request)."""
+        return dict(self.session.cookies)
+
+    @_cookies.setter
+    def _cookies(self, cookies: Dict[str, str]) -> None:
+        self.session.cookies.clear()
+        self.session.cookies.update(cookies)
+
+    def invalidate_cache(self) -> None:
+        """Drop cached responses so the next calls query the NAS again."""
+        self._cache.clear()
+
+    def _cached(self, key: str, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the cached response for key, fetching it if missing or older than the TTL.
+
+        Args:
+            key: The cache key for the endpoint
+            fetch: Callable that queries the NAS
+
+        Each caller gets its own copy, so mutating a returned response never alters the cache.
+
+        Returns:
+            Dict[str, Any]: The cached or freshly fetched response
+        """
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < STATIC_INFO_TTL:
+            return copy.deepcopy(entry[1])
+
+        response = fetch()
+        self._cache[key] = (time.monotonic(), copy.deepcopy(response))
+        return response
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "WDNasClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
     def authenticate(self) -> bool:
         """Authenticate with the NAS.
 
@@ -69,24 +153,40 @@ class WDNasClient:
             AuthenticationError: If authentication failed
             ConnectionError: If there was a problem connecting to the NAS
         """
-        try:
-            # WD EX2 Ultra expects a JSON payload with username and password
-            # The password appears to be base64 encoded in the Postman collection
-            auth_data = {
-                "username": self.username,
-                "password": base64.b64encode(self.password.encode()).decode(),
-            }
+        generation = self._auth_generation
+        with self._auth_lock:
+            if self._authenticated and self._auth_generation != generation:
+                self.logger.debug("Reusing login completed by a concurrent caller")
+                return True
+            return self._login()
+
+    def _login(self) -> bool:
+        """Post the credentials to the auth endpoint, called with the auth lock held.
+
+        Returns:
+            bool: True if authentication was successful
+
+        Raises:
+            AuthenticationError: If authentication failed
+            ConnectionError: If there was a problem connecting to the NAS
+        """
+        # WD EX2 Ultra expects a JSON payload with username and base64 encoded password
+        # (as in the Postman collection); build it from the current credentials on every login
+        auth_data = {
+            "username": self.username,
+            "password": base64.b64encode(self.password.encode()).decode(),
+        }
 
+        try:
             # Disable SSL verification since the NAS often uses a self-signed certificate
             # In production, you might want to provide the correct certificate instead
-            response = self.session.post(
-                f"{self.https_base_url}/nas/v1/auth", json=auth_data, timeout=TIMEOUT_REQUESTS
-            )
+            response = self.session.post(self._auth_url, json=auth_data, timeout=TIMEOUT_REQUESTS)
 
             if response.status_code == 200:
-                # Store cookies for subsequent requests
-                self._cookies = dict(response.cookies)
+                # Keep the session cookies in the session jar for subsequent requests
+                self.session.cookies.update(response.cookies)
                 self._authenticated = True
+                self._auth_generation += 1
                 self.logger.info("Successfully authenticated with NAS")
                 return True
             else:
@@ -121,22 +221,19 @@ class WDNasClient:
         try:
             # Use the https_base_url for CGI requests
             url = f"{self.https_base_url}{cgi_path}"
-            headers = {"Content-Type": "application/x-www-form-urlencoded"} # All requests for WD NAS use this
-            
             response = self.session.post(
                 url,
                 data=form_data,
-                headers=headers,
-                cookies=self._cookies,
+                headers=CGI_HEADERS,
                 timeout=TIMEOUT_REQUESTS,
             )
             response.raise_for_status()
 
-            # Immediately parse the XML response
+            # Parse the raw bytes: response.text would run charset detection first
             if json_response:
-                return self.parse_json_response(response.text)
+                return self.parse_json_response(response.content)
             else:
-                return self.parse_xml_response_as_dict(response.text)
+                return self.parse_xml_response_as_dict(response.content)
 
         except requests.HTTPError as e:
             if e.response.status_code == 401:
@@ -161,13 +258,11 @@ class WDNasClient:
 
         try:
             url = f"{self.http_base_url}{path}"
-            response = self.session.post(
-                url, cookies=self._cookies, params=params, timeout=TIMEOUT_REQUESTS
-            )
+            response = self.session.post(url, params=params, timeout=TIMEOUT_REQUESTS)
             response.raise_for_status()
 
-            # Immediately parse the XML response
-            return self.parse_xml_response_as_dict(response.text)
+            # Parse the raw bytes: response.text would run charset detection first
+            return self.parse_xml_response_as_dict(response.content)
 
         except requests.HTTPError as e:
             if e.response.status_code == 401:
@@ -177,11 +272,11 @@ class WDNasClient:
         except RequestException as e:
             raise ConnectionError(f"Request failed: {str(e)}")
 
-    def parse_xml_response_as_dict(self, xml_text: str) -> Dict[str, Any]:
+    def parse_xml_response_as_dict(self, xml_text: Union[str, bytes]) -> Dict[str, Any]:
         """Parse an XML response and convert it to a dictionary.
 
         Args:
-            xml_text: The XML text to parse
+            xml_text: The XML text to parse, either decoded or as raw response bytes
 
         Returns:
             Dict: The parsed XML as a dictionary
@@ -196,14 +291,14 @@ class WDNasClient:
             return result
         except Exception as e:
             self.logger.error(f"Failed to parse XML response: {str(e)}")
-            self.logger.debug(f"Raw response: {xml_text[:200]}...")
+            self.logger.debug(f"Raw response: {xml_text[:200]!r}...")
             raise ParseError(f"Failed to parse XML response: {str(e)}")
 
-    def parse_json_response(self, json_text: str) -> Dict[str, Any]:
+    def parse_json_response(self, json_text: Union[str, bytes]) -> Dict[str, Any]:
         """Parse a JSON response.
 
         Args:
-            json_text: The JSON text to parse
+            json_text: The JSON text to parse, either decoded or as raw response bytes
 
         Returns:
             Dict: The parsed JSON as a dictionary
@@ -219,7 +314,7 @@ class WDNasClient:
                 raise ParseError(f"Unexpected JSON structure: {type(response)}")
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse JSON response: {str(e)}")
-            self.logger.debug(f"Raw response: {json_text[:200]}...")
+            self.logger.debug(f"Raw response: {json_text[:200]!r}...")
             raise ParseError(f"Failed to parse JSON response: {str(e)}")
 
     def get_system_status(self) -> Dict[str, Any]:
@@ -233,10 +328,15 @@ class WDNasClient:
     def get_device_info(self) -> Dict[str, Any]:
         """Get device information.
 
+        The response is cached for STATIC_INFO_TTL seconds, see invalidate_cache().
+
         Returns:
             Dict: Device information
         """
-        return self._post_cgi("/cgi-bin/system_mgr.cgi", {"cmd": "cgi_get_device_info"})
+        return self._cached(
+            "device_info",
+            lambda: self._post_cgi("/cgi-bin/system_mgr.cgi", {"cmd": "cgi_get_device_info"}),
+        )
 
     def get_system_logs(self, max_pages: int = 10) -> List[Dict[str, List[Dict[str, Any]]]]:
         """Get system logs with pagination.
@@ -247,31 +347,49 @@ class WDNasClient:
         Returns:
             List[Dict]: System logs information from all available pages up to max_pages
         """
-        all_logs: List[Dict[str, List[Dict[str, Any]]]] = []
-        page = 1
+        return list(self.iter_system_logs(max_pages))
+
+    def iter_system_logs(self, max_pages: int = 10) -> Iterator[Dict[str, List[Dict[str, Any]]]]:
+        """Iterate over system log pages in order, up to and including the first empty one.
+
+        Unlike get_system_logs, callers can stop early without holding every page.
+
+        Args:
+            max_pages: Maximum number of pages to retrieve (default: 10)
+
+        Yields:
+            Dict: One page of system logs
+        """
 
-        while page <= max_pages:
+        def fetch(page: int) -> Dict[str, List[Dict[str, Any]]]:
             data = {
                 "page": str(page),
                 "cmd": "cgi_log_system",
             }
-            response = self._post_cgi("/cgi-bin/system_mgr.cgi", data, json_response=True)
-
-            all_logs.append(response)
-            if not response.get("rows"):
-                break
-
-            page += 1
-
-        return all_logs
+            return self._post_cgi("/cgi-bin/system_mgr.cgi", data, json_response=True)
+
+        # Request pages in small batches so their round trips overlap, and stop at the
+        # first empty page (at most LOG_PAGE_BATCH - 1 pages are fetched needlessly)
+        with ThreadPoolExecutor(max_workers=LOG_PAGE_BATCH) as executor:
+            for first_page in range(1, max_pages + 1, LOG_PAGE_BATCH):
+                pages = range(first_page, min(first_page + LOG_PAGE_BATCH, max_pages + 1))
+                for response in executor.map(fetch, pages):
+                    yield response
+                    if not response.get("rows"):
+                        return
 
     def get_firmware_version(self) -> Dict[str, Any]:
         """Get firmware version information.
 
+        The response is cached for STATIC_INFO_TTL seconds, see invalidate_cache().
+
         Returns:
             Dict[str, Any]: Firmware version information as dictionary
         """
-        return self._post_cgi("/cgi-bin/system_mgr.cgi", {"cmd": "get_firm_v_xml"})
+        return self._cached(
+            "firmware_version",
+            lambda: self._post_cgi("/cgi-bin/system_mgr.cgi", {"cmd": "get_firm_v_xml"}),
+        )
 
     def get_home_info(self) -> Dict[str, Any]:
         """Get home information.
@@ -282,27 +400,28 @@ class WDNasClient:
         return self._post_cgi("/cgi-bin/home_mgr.cgi", {"cmd": "2"})
 
     def get_disks_smart_info(self) -> Dict[str, Dict[str, Any]]:
-        """Get SMART information for a disk.
+        """Get SMART information for all disks.
 
-        Args:
-            disk_id: The disk ID (e.g., 'sda', 'sdb')
+        Each bay is queried concurrently, so the total time does not grow with the
+        number of disks. Empty bays (no SMART rows) are left out of the result.
 
         Returns:
-            Dict: SMART information for the disk
+            Dict[str, Dict[str, Any]]: SMART information keyed by disk ID (e.g., 'sda', 'sdb')
         """
-        disks_info: Dict[str, Dict[str, Any]] = {}
-
         LIST_DISKS = ["sda", "sdb"]  # TODO: get this from the NAS
 
-        for disk_id in LIST_DISKS:
+        def fetch(disk_id: str) -> Dict[str, Any]:
             data = {"f_field": disk_id, "cmd": "cgi_Status_SMART_HD_Info"}
-            response = self._post_cgi("/cgi-bin/smart.cgi", data)
-            if response["rows"].get("row"):
-                disks_info[disk_id] = response
-            else:
-                break
+            return self._post_cgi("/cgi-bin/smart.cgi", data)
 
-        return disks_info
+        with ThreadPoolExecutor(max_workers=len(LIST_DISKS)) as executor:
+            responses = list(executor.map(fetch, LIST_DISKS))
+
+        return {
+            disk_id: response
+            for disk_id, response in zip(LIST_DISKS, responses)
+            if response["rows"].get("row")
+        }
 
     def get_system_info(self) -> Dict[str, Any]:
         """Get detailed system information.
@@ -311,23 +430,28 @@ class WDNasClient:
             Dict[str, Any]: System information as dictionary
         """
         # The id parameter appears to be a timestamp or random number
-        import time
-
         params = {"id": str(int(time.time()))}
         return self._get_xml("/xml/sysinfo.xml", params)
 
     def get_all_data(self) -> Dict[str, Any]:
         """Get all data from the NAS.
 
+        The endpoints are independent, so they are queried concurrently and the
+        total time is bounded by the slowest call rather than their sum.
+
         Returns:
             Dict[str, Any]: All data as dictionary
         """
-        return {
-            "system_status": self.get_system_status(),
-            "device_info": self.get_device_info(),
-            "system_logs": self.get_system_logs(),
-            "firmware_version": self.get_firmware_version(),
-            "home_info": self.get_home_info(),
-            "disks_smart_info": self.get_disks_smart_info(),
-            "system_info": self.get_system_info(),
+        jobs: Dict[str, Callable[[], Any]] = {
+            "system_status": self.get_system_status,
+            "device_info": self.get_device_info,
+            "system_logs": self.get_system_logs,
+            "firmware_version": self.get_firmware_version,
+            "home_info": self.get_home_info,
+            "disks_smart_info": self.get_disks_smart_info,
+            "system_info": self.get_system_info,
         }
+
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {key: executor.submit(job) for key, job in jobs.items()}
+            return {key: future.result() for key, future in futures.items()}
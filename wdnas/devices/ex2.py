@@ -1,12 +1,157 @@
 """Implementation for WD My Cloud EX2 Ultra."""
 
-from typing import List
+import re
+from functools import lru_cache
+from itertools import chain
+from sys import intern
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..models.disk import DiskInfo, SmartAttribute, SmartInfo
 from ..models.system import SystemInfo, RaidInfo, VolumeInfo, LogEntry
 from .base import WDNasDevice
 from datetime import datetime
 
+# Example: "Pass [2025/02/28 02:07:22]" -> ("Pass", "2025/02/28 02:07:22"); the status is
+# everything before the bracket, so multi-word statuses like "Not Tested" are kept whole
+_SMART_RESULT_RE = re.compile(r"\s*([^\[]*?)\s*\[([^\]]*)\]")
+_SMART_DATE_FORMAT = "%Y/%m/%d %H:%M:%S"
+# Zero-padded dates as the firmware normally reports them; matching digit groups and building
+# the datetime directly is much cheaper than strptime
+_SMART_DATE_RE = re.compile(r"(\d{4})/(\d{2})/(\d{2}) (\d{2}):(\d{2}):(\d{2})", re.ASCII)
+
+# Flags come as "0"/"1" for disks and "true"/"false" for volumes; accept either form
+_is_truthy: Callable[[str], bool] = frozenset({"1", "true"}).__contains__
+
+
+def _interned(value: Optional[str]) -> Optional[str]:
+    """Intern values that repeat across disks, raids and volumes; empty elements stay None."""
+    return value if value is None else intern(value)
+
+
+def _raw(value: Optional[str]) -> Optional[str]:
+    """Pass a string field through unchanged; empty XML elements stay None."""
+    return value
+
+
+# DiskInfo field -> (system info disk key, converter)
+_DISK_FIELDS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "scsi_path": ("scsi_path", _raw),
+    "connected": ("connected", _is_truthy),
+    "vendor": ("vendor", _interned),
+    "model": ("model", _interned),
+    "revision": ("rev", _raw),
+    "serial": ("sn", _raw),
+    "device_path": ("dev", _raw),
+    "size_bytes": ("size", int),
+    "partition_count": ("part_cnt", int),
+    "allowed": ("allowed", _is_truthy),
+    "raid_uuid": ("raid_uuid", _raw),
+    "failed": ("failed", _is_truthy),
+    "healthy": ("healthy", _is_truthy),
+    "removable": ("removable", _is_truthy),
+    "roaming": ("roaming", _raw),
+    "temperature": ("temp", int),
+    "over_temp": ("over_temp", _is_truthy),
+    "sleep": ("sleep", _is_truthy),
+}
+
+
+# VolumeInfo field -> (system info vol key, converter)
+_VOLUME_FIELDS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "id": ("num", int),
+    "name": ("name", _raw),
+    "label": ("label", _raw),
+    "mount_point": ("mnt", _raw),
+    "encrypted": ("encrypted", _is_truthy),
+    "device_path": ("dev", _raw),
+    "unlocked": ("unlocked", _is_truthy),
+    "mounted": ("mounted", _is_truthy),
+    "size": ("size", int),
+    "uuid": ("uuid", _raw),
+    "roaming": ("roaming", _is_truthy),
+    "used_size": ("used_size", int),
+    "raid_level": ("raid_level", _interned),
+    "raid_state": ("raid_state", _interned),
+    "raid_state_detail": ("raid_state_detail", _raw),
+    "state": ("state", _interned),
+}
+
+# RaidInfo field -> converter for the raw string value (raid keys match the field names)
+_RAID_SCHEMA: Dict[str, Callable[[str], Any]] = {
+    "id": int,
+    "level": _interned,
+    "chunk_size": int,
+    "num_of_total_disks": int,
+    "num_of_raid_disks": int,
+    "num_of_active_disks": int,
+    "num_of_working_disks": int,
+    "num_of_spare_disks": int,
+    "num_of_failed_disks": int,
+    "raid_disks": _raw,
+    "spare_disks": _raw,
+    "failed_disks": _raw,
+    "rebuilding_disks": _raw,
+    "size": int,
+    "used_size": int,
+    "min_req_size": int,
+    "state": _interned,
+    "state_detail": _raw,
+    "uuid": _raw,
+    "dev": _raw,
+    "ar": int,
+    "expand_size": int,
+    "expand_no_replace": int,
+    "migrate_from": _raw,
+    "migrate_to": _raw,
+    "recover_failed": int,
+    "reshape_failed": int,
+    "dirty": int,
+}
+
+
+def _parse_smart_date(date_str: str) -> datetime:
+    """Parse a SMART test date, using the digit-group fast path when possible.
+
+    Args:
+        date_str: The date, e.g. "2025/02/28 02:07:22"
+
+    Returns:
+        datetime: The parsed date
+
+    Raises:
+        ValueError: If the string isn't a valid date in the expected format
+    """
+    match = _SMART_DATE_RE.fullmatch(date_str)
+    if match:
+        try:
+            year, month, day, hour, minute, second = map(int, match.groups())
+            return datetime(year, month, day, hour, minute, second)
+        except ValueError:
+            pass  # Out-of-range field; let strptime produce the canonical error
+    # Non-padded fields (e.g. "2024/1/2 3:04:05") only parse through strptime
+    return datetime.strptime(date_str, _SMART_DATE_FORMAT)
+
+
+# SMART results only change when a new self-test runs, so repeated polls hit the cache and
+# the date is only parsed once per distinct result
+@lru_cache(maxsize=256)
+def _parse_smart_result(smart_result: str) -> Tuple[str, datetime]:
+    """Split a SMART result string into its status and test date.
+
+    Args:
+        smart_result: The raw result, e.g. "Pass [2025/02/28 02:07:22]"
+
+    Returns:
+        Tuple[str, datetime]: The status (e.g. "Pass") and the date of the test
+
+    Raises:
+        ValueError: If the string doesn't match the expected format
+    """
+    match = _SMART_RESULT_RE.match(smart_result)
+    if not match:
+        raise ValueError(f"Unexpected SMART result format: {smart_result}")
+    return match.group(1), _parse_smart_date(match.group(2).strip())
+
 
 class EX2UltraDevice(WDNasDevice):
     """Implementation for WD My Cloud EX2 Ultra."""
@@ -28,93 +173,57 @@ class EX2UltraDevice(WDNasDevice):
         """
         self.client.logger.debug("Getting system information")
 
+        config = self.all_data["system_info"]["config"]
+        status = self.all_data["system_status"]["xml"]
+        device_info = self.all_data["device_info"]["device_info"]
+        firmware = self.all_data["firmware_version"]["version"]
+
         raids = [
-            RaidInfo(
-                id=int(raid["id"]),
-                level=raid["level"],
-                chunk_size=int(raid["chunk_size"]),
-                num_of_total_disks=int(raid["num_of_total_disks"]),
-                num_of_raid_disks=int(raid["num_of_raid_disks"]),
-                num_of_active_disks=int(raid["num_of_active_disks"]),
-                num_of_working_disks=int(raid["num_of_working_disks"]),
-                num_of_spare_disks=int(raid["num_of_spare_disks"]),
-                num_of_failed_disks=int(raid["num_of_failed_disks"]),
-                raid_disks=raid["raid_disks"],
-                spare_disks=raid["spare_disks"],
-                failed_disks=raid["failed_disks"],
-                rebuilding_disks=raid["rebuilding_disks"],
-                size=int(raid["size"]),
-                used_size=int(raid["used_size"]),
-                min_req_size=int(raid["min_req_size"]),
-                state=raid["state"],
-                state_detail=raid["state_detail"],
-                uuid=raid["uuid"],
-                dev=raid["dev"],
-                ar=int(raid["ar"]),
-                expand_size=int(raid["expand_size"]),
-                expand_no_replace=int(raid["expand_no_replace"]),
-                migrate_from=raid["migrate_from"],
-                migrate_to=raid["migrate_to"],
-                recover_failed=int(raid["recover_failed"]),
-                reshape_failed=int(raid["reshape_failed"]),
-                dirty=int(raid["dirty"]),
-            )
-            for raid in self.all_data["system_info"]["config"]["raids"]["raid"]
+            RaidInfo(**{field: convert(raid[field]) for field, convert in _RAID_SCHEMA.items()})
+            for raid in config["raids"]["raid"]
         ]
 
         volumes = [
             VolumeInfo(
-                id=int(volume["num"]),
-                name=volume["name"],
-                label=volume["label"],
-                mount_point=volume["mnt"],
-                encrypted=volume["encrypted"] == "true",
-                device_path=volume["dev"],
-                unlocked=volume["unlocked"] == "true",
-                mounted=volume["mounted"] == "true",
-                size=int(volume["size"]),
-                uuid=volume["uuid"],
-                roaming=volume["roaming"] == "true",
-                used_size=int(volume["used_size"]),
-                raid_level=volume["raid_level"],
-                raid_state=volume["raid_state"],
-                raid_state_detail=volume["raid_state_detail"],
-                state=volume["state"],
+                **{field: convert(volume[key]) for field, (key, convert) in _VOLUME_FIELDS.items()}
             )
-            for volume in self.all_data["system_info"]["config"]["vols"]["vol"]
+            for volume in config["vols"]["vol"]
         ]
 
-        log_groups: List[List[LogEntry]] = [
-            [
-                LogEntry(
-                    timestamp=log["cell"][1],
-                    level=log["cell"][0],
-                    service=log["cell"][2],
-                    message=log["cell"][3],
+        # Flatten the pages without building a list per page first; level and service repeat
+        # across entries, so intern them to share one string object per value
+        logs: List[LogEntry] = list(
+            chain.from_iterable(
+                (
+                    LogEntry(
+                        timestamp=log["cell"][1],
+                        level=_interned(log["cell"][0]),
+                        service=_interned(log["cell"][2]),
+                        message=log["cell"][3],
+                    )
+                    for log in log_group["rows"]
                 )
-                for log in log_group["rows"]
-            ]
-            for log_group in self.all_data["system_logs"]
-        ]
-        logs: List[LogEntry] = [log for log_group in log_groups for log in log_group] # Flatten the list
+                for log_group in self.all_data["system_logs"]
+            )
+        )
 
         return SystemInfo(
-            serial_number=self.all_data["device_info"]["device_info"]["serial_number"],
-            name=self.all_data["device_info"]["device_info"]["name"],
-            workgroup=self.all_data["device_info"]["device_info"]["workgroup"],
-            description=self.all_data["device_info"]["device_info"]["description"],
-            firmware_version=self.all_data["firmware_version"]["version"]["fw"],
-            oled=self.all_data["firmware_version"]["version"]["oled"],
+            serial_number=device_info["serial_number"],
+            name=device_info["name"],
+            workgroup=device_info["workgroup"],
+            description=device_info["description"],
+            firmware_version=firmware["fw"],
+            oled=firmware["oled"],
             fan_speed=int(self.all_data["home_info"]["config"]["fan"]),
-            lan_r_speed=int(self.all_data["system_status"]["xml"]["lan_r_speed"]),
-            lan_t_speed=int(self.all_data["system_status"]["xml"]["lan_t_speed"]),
-            lan2_r_speed=int(self.all_data["system_status"]["xml"]["lan2_r_speed"]),
-            lan2_t_speed=int(self.all_data["system_status"]["xml"]["lan2_t_speed"]),
-            memory_total=int(self.all_data["system_status"]["xml"]["mem_total"]),
-            memory_free=int(self.all_data["system_status"]["xml"]["mem_free"]),
-            memory_buffers=int(self.all_data["system_status"]["xml"]["buffers"]),
-            memory_cached=int(self.all_data["system_status"]["xml"]["cached"]),
-            cpu_usage=float(int(self.all_data["system_status"]["xml"]["cpu"].replace("%", "")) / 100.0),
+            lan_r_speed=int(status["lan_r_speed"]),
+            lan_t_speed=int(status["lan_t_speed"]),
+            lan2_r_speed=int(status["lan2_r_speed"]),
+            lan2_t_speed=int(status["lan2_t_speed"]),
+            memory_total=int(status["mem_total"]),
+            memory_free=int(status["mem_free"]),
+            memory_buffers=int(status["buffers"]),
+            memory_cached=int(status["cached"]),
+            cpu_usage=int(status["cpu"].rstrip("%")) / 100,
             raids=raids,
             volumes=volumes,
             logs=logs,
@@ -129,13 +238,12 @@ class EX2UltraDevice(WDNasDevice):
         self.client.logger.debug("Getting disk information")
 
         disks: List[DiskInfo] = []
+        system_disks = {
+            disk["name"]: disk for disk in self.all_data["system_info"]["config"]["disks"]["disk"]
+        }
 
         for disk_name, disk_smart_data in self.all_data["disks_smart_info"].items():
-
-            disk_from_system = self.all_data["system_info"]["config"]["disks"]["disk"]
-            disk_from_system = next(
-                (disk for disk in disk_from_system if disk["name"] == disk_name), None
-            )
+            disk_from_system = system_disks.get(disk_name)
             if not disk_from_system:
                 raise ValueError(f"Disk {disk_name} not found in system info")
 
@@ -150,40 +258,19 @@ class EX2UltraDevice(WDNasDevice):
                 for attr in disk_smart_data["rows"]["row"]
             ]
 
-            # Example: <result>Pass [2025/02/28 02:07:22]</result>
-            result = disk_from_system["smart"]["result"].split(" ")[0]
-            date_str = disk_from_system["smart"]["result"].split("[")[1].split("]")[0].strip()
+            result, date = _parse_smart_result(disk_from_system["smart"]["result"])
 
             smart_info = SmartInfo(
                 result=result,
                 test_type=disk_from_system["smart"]["test"],
-                date=datetime.strptime(date_str, "%Y/%m/%d %H:%M:%S"),
+                date=date,
                 percent=float(int(disk_from_system["smart"]["percent"]) / 100),
                 attributes=smart_attributes,
             )
 
-            disks.append(
-                DiskInfo(
-                    name=disk_name,
-                    scsi_path=disk_from_system["scsi_path"],
-                    connected=disk_from_system["connected"] == "1",
-                    vendor=disk_from_system["vendor"],
-                    model=disk_from_system["model"],
-                    revision=disk_from_system["rev"],
-                    serial=disk_from_system["sn"],
-                    device_path=disk_from_system["dev"],
-                    size_bytes=int(disk_from_system["size"]),
-                    partition_count=int(disk_from_system["part_cnt"]),
-                    allowed=disk_from_system["allowed"] == "1",
-                    raid_uuid=disk_from_system["raid_uuid"],
-                    failed=disk_from_system["failed"] == "1",
-                    healthy=disk_from_system["healthy"] == "1",
-                    removable=disk_from_system["removable"] == "1",
-                    roaming=disk_from_system["roaming"],
-                    smart_info=smart_info,
-                    temperature=int(disk_from_system["temp"]),
-                    over_temp=disk_from_system["over_temp"] == "1",
-                    sleep=disk_from_system["sleep"] == "1",
-                )
-            )
+            fields = {
+                field: convert(disk_from_system[key])
+                for field, (key, convert) in _DISK_FIELDS.items()
+            }
+            disks.append(DiskInfo(name=disk_name, smart_info=smart_info, **fields))
         return disks
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartAttribute:
     """Represents a single SMART attribute."""
 
@@ -16,7 +16,7 @@ class SmartAttribute:
     threshold: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartInfo:
     """SMART information for a disk."""
 
@@ -27,7 +27,7 @@ class SmartInfo:
     attributes: List[SmartAttribute]
 
 
-@dataclass
+@dataclass(slots=True)
 class DiskInfo:
     """Information about a disk in the NAS."""
 
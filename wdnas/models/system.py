@@ -1,20 +1,20 @@
 """System model for WD NAS devices."""
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """Log entry for the NAS system."""
 
     timestamp: str
-    level: str
-    service: str
+    level: Optional[str]
+    service: Optional[str]
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeInfo:
     """Information about a volume in the NAS."""
 
@@ -36,7 +36,7 @@ class VolumeInfo:
     state: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RaidInfo:
     """RAID information for the NAS system."""
 
@@ -70,7 +70,7 @@ class RaidInfo:
     dirty: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemInfo:
     """Information about the NAS system."""
 